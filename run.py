@@ -1,17 +1,81 @@
+import argparse
 import os
 import sys
+import time
 
 # Add src to path so we can import our modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
 
+from config.settings import settings
 from main import AuPoSoNeOrchestrator
 
+# Seconds between settings file checks while the daemon waits
+SETTINGS_CHECK_INTERVAL = 5
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the AuPoSoNe automation.")
+    parser.add_argument(
+        "--profile",
+        help="Settings profile to load from the settings file",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep processing clips, reloading the settings file when it changes",
+    )
+    return parser.parse_args()
+
+
+def wait_until_next_cycle():
+    waiting_since = time.monotonic()
+
+    while True:
+        # Re-read the interval on every step so lowering it takes effect now
+        remaining = settings.DAEMON_POLL_INTERVAL - (time.monotonic() - waiting_since)
+        if remaining <= 0:
+            return
+
+        time.sleep(min(SETTINGS_CHECK_INTERVAL, remaining))
+
+        try:
+            settings.reload_if_changed()
+        except Exception as e:
+            print(f"❌ Error: {e}")
+
+
+def run_daemon(orchestrator):
+    print("Running in daemon mode, press Ctrl+C to stop.")
+
+    try:
+        while True:
+            try:
+                settings.reload_if_changed()
+                orchestrator.process_clips("Valorant")
+                print("✅ Automation cycle completed successfully!")
+            except Exception as e:
+                print(f"❌ Error: {e}")
+
+            print(f"Next cycle in {settings.DAEMON_POLL_INTERVAL} seconds...")
+            wait_until_next_cycle()
+    except KeyboardInterrupt:
+        print("Daemon stopped.")
+
 
 def main():
+    args = parse_args()
+
     try:
         print("Starting AuPoSoNe automation...")
 
+        settings.load(args.profile)
+
         orchestrator = AuPoSoNeOrchestrator()
+
+        if args.daemon:
+            run_daemon(orchestrator)
+            return 0
+
         orchestrator.process_clips("Valorant")
 
         print("✅ Automation completed successfully!")
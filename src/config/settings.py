@@ -1,5 +1,8 @@
 """Configuration settings for the application."""
 
+import copy
+import json
+import math
 import os
 
 from dotenv import load_dotenv
@@ -30,7 +33,50 @@ class Settings:
     # Video Processing Configuration
     ROOT_PATH = os.path.join(os.getcwd(), "clips")
     VIDEO_FILE_EXTENSION = ".mp4"
+    DEDUP_HISTORY_PATH = os.path.join(ROOT_PATH, "dedup_history.json")
+
+    # Settings File Configuration
+    SETTINGS_FILE = os.getenv(
+        "SETTINGS_FILE", os.path.join(os.getcwd(), "settings.json")
+    )
+    SETTINGS_PROFILE = os.getenv("SETTINGS_PROFILE", "default")
+
+    # Tunable knobs, overridable by the settings file and environment variables.
+    # Each knob maps to its expected type and its minimum value (if any).
+    KNOBS = {
+        "CLIPS_COUNT": (int, 1),
+        "DAEMON_POLL_INTERVAL": (int, 1),
+        "ENCODE_PROFILE": (str, None),
+        "ENCODE_PROFILES": (dict, None),
+        "DOWNLOAD_CHUNK_SIZE": (int, 1024),
+        "HTTP_POOL_SIZE": (int, 1),
+        "CHROME_OPTIONS": (list, None),
+        "SCRAPER_WAIT_TIMEOUT": (int, 1),
+        "INSTAGRAM_RETRY_INTERVAL": (int, 1),
+        "INSTAGRAM_MAX_WAIT_TIME": (int, 1),
+        "DEDUP_WORKERS": (int, 1),
+        "DEDUP_CANDIDATE_FACTOR": (int, 1),
+        "DEDUP_HISTORY_HOURS": (int, 0),
+        "DEDUP_HISTORY_MAX_CLIPS": (int, 0),
+        "DEDUP_THUMBNAIL_MAX_DISTANCE": (int, 0),
+        "DEDUP_KEYFRAME_MAX_DISTANCE": (int, 0),
+        "DEDUP_KEYFRAME_MATCH_RATIO": (float, 0),
+        "DEDUP_MAX_KEYFRAMES": (int, 1),
+    }
+
+    # Pipeline Configuration
     CLIPS_COUNT = 1
+    DAEMON_POLL_INTERVAL = 3600
+
+    # Encoding Configuration
+    ENCODE_PROFILE = "fps"
+    ENCODE_PROFILES = {
+        "fps": "[0:v]crop=ih*4/3:ih:(iw-ih*4/3)/2:0,scale=1080:-1[cropped];[cropped]scale=-1:1920,boxblur=luma_radius=min(h\\,w)/40:luma_power=3:chroma_radius=min(cw\\,ch)/40:chroma_power=1[bg];[bg][cropped]overlay=(W-w)/2:(H-h)/2,setsar=1,crop=w=1080:h=1920"
+    }
+    DOWNLOAD_CHUNK_SIZE = 8192
+
+    # HTTP Configuration
+    HTTP_POOL_SIZE = 10
 
     # Chrome WebDriver Configuration
     CHROME_OPTIONS = [
@@ -39,6 +85,25 @@ class Settings:
         "--no-sandbox",
         "--disable-dev-shm-usage",
     ]
+    SCRAPER_WAIT_TIMEOUT = 60
+
+    # Instagram Publishing Configuration
+    INSTAGRAM_RETRY_INTERVAL = 60
+    INSTAGRAM_MAX_WAIT_TIME = 600
+
+    # Duplicate Detection Configuration
+    DEDUP_WORKERS = 4
+    DEDUP_CANDIDATE_FACTOR = 3
+    DEDUP_HISTORY_HOURS = 72
+    DEDUP_HISTORY_MAX_CLIPS = 500
+    DEDUP_THUMBNAIL_MAX_DISTANCE = 10
+    DEDUP_KEYFRAME_MAX_DISTANCE = 12
+    DEDUP_KEYFRAME_MATCH_RATIO = 0.5
+    DEDUP_MAX_KEYFRAMES = 30
+
+    def __init__(self):
+        # Class defaults apply until load() reads the settings file and env
+        self._settings_file_mtime = None
 
     @property
     def instagram_root_url(self):
@@ -70,6 +135,153 @@ class Settings:
                 f"Missing required environment variables: {', '.join(missing_vars)}"
             )
 
+    def load(self, profile=None):
+        """
+        Load the tunable knobs for a profile.
+
+        Values are resolved from the class defaults, then the "default" section
+        of the settings file, then the selected profile, then environment
+        variables named after the knobs.
+
+        Args:
+            profile: Name of the profile to load (default: current profile)
+
+        Raises:
+            ValueError: If the settings file, the profile or a knob is invalid
+        """
+        if profile is None:
+            profile = self.SETTINGS_PROFILE
+
+        mtime = self._get_settings_file_mtime()
+        values = {name: copy.deepcopy(getattr(Settings, name)) for name in self.KNOBS}
+
+        file_data = self._read_settings_file() if mtime is not None else {}
+        profiles = file_data.get("profiles", {})
+        values.update(file_data.get("default", {}))
+
+        if profile != "default":
+            if profile not in profiles:
+                raise ValueError(f"Unknown settings profile '{profile}'")
+            values.update(profiles[profile])
+
+        for name in self.KNOBS:
+            env_value = os.getenv(name)
+            if env_value is not None:
+                values[name] = self._parse_env_value(name, env_value)
+
+        self._validate_knobs(values)
+
+        # Only apply the knobs once they are all valid
+        for name in self.KNOBS:
+            setattr(self, name, values[name])
+        self.SETTINGS_PROFILE = profile
+        self._settings_file_mtime = mtime
+
+    def reload_if_changed(self):
+        """
+        Reload the knobs if the settings file changed since the last load.
+
+        Invalid settings are reported and the previous values are kept, so a
+        bad edit never stops a running daemon.
+
+        Returns:
+            bool: True if new settings were applied
+        """
+        if self._get_settings_file_mtime() == self._settings_file_mtime:
+            return False
+
+        try:
+            self.load()
+        except ValueError as e:
+            print(f"Keeping previous settings, could not reload: {e}")
+            return False
+
+        print(f"Reloaded settings profile '{self.SETTINGS_PROFILE}'")
+        return True
+
+    def _get_settings_file_mtime(self):
+        """Get the settings file modification time, or None if it is missing."""
+        try:
+            return os.path.getmtime(self.SETTINGS_FILE)
+        except OSError:
+            return None
+
+    def _read_settings_file(self):
+        """Read the settings file and check its layout."""
+        try:
+            with open(self.SETTINGS_FILE, "r", encoding="utf-8") as f:
+                file_data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Could not read {self.SETTINGS_FILE}: {e}")
+
+        if not isinstance(file_data, dict):
+            raise ValueError(f"{self.SETTINGS_FILE} must contain a JSON object")
+
+        profiles = file_data.get("profiles", {})
+        if not isinstance(profiles, dict):
+            raise ValueError(f"'profiles' in {self.SETTINGS_FILE} must be an object")
+
+        sections = [("default", file_data.get("default", {}))]
+        sections += list(profiles.items())
+        for section_name, section in sections:
+            if not isinstance(section, dict):
+                raise ValueError(f"Settings profile '{section_name}' must be an object")
+            unknown_knobs = set(section) - set(self.KNOBS)
+            if unknown_knobs:
+                raise ValueError(
+                    f"Unknown settings in profile '{section_name}': "
+                    f"{', '.join(sorted(unknown_knobs))}"
+                )
+
+        return file_data
+
+    def _parse_env_value(self, name, env_value):
+        """Convert an environment variable to the type of its knob."""
+        expected_type = self.KNOBS[name][0]
+        try:
+            if expected_type in (list, dict):
+                return json.loads(env_value)
+            return expected_type(env_value)
+        except ValueError:
+            raise ValueError(
+                f"Invalid value for {name}: expected {expected_type.__name__}, "
+                f"got '{env_value}'"
+            )
+
+    def _validate_knobs(self, values):
+        """Check the type and range of every knob."""
+        for name, (expected_type, minimum) in self.KNOBS.items():
+            value = values[name]
+
+            # Accept integers where floats are expected, but never booleans
+            if expected_type is float and type(value) is int:
+                value = values[name] = float(value)
+
+            if type(value) is not expected_type:
+                raise ValueError(
+                    f"Invalid value for {name}: expected {expected_type.__name__}, "
+                    f"got {type(value).__name__}"
+                )
+            if expected_type is float and not math.isfinite(value):
+                raise ValueError(f"Invalid value for {name}: must be a finite number")
+            if minimum is not None and value < minimum:
+                raise ValueError(f"Invalid value for {name}: must be >= {minimum}")
+
+        if not all(isinstance(option, str) for option in values["CHROME_OPTIONS"]):
+            raise ValueError("Invalid value for CHROME_OPTIONS: expected strings")
+        for profile_name, filter_graph in values["ENCODE_PROFILES"].items():
+            if not isinstance(filter_graph, str) or not filter_graph:
+                raise ValueError(
+                    f"Invalid encode profile '{profile_name}': "
+                    "expected a non-empty FFmpeg filter graph string"
+                )
+        if values["ENCODE_PROFILE"] not in values["ENCODE_PROFILES"]:
+            raise ValueError(f"Unknown encode profile '{values['ENCODE_PROFILE']}'")
+        if values["DEDUP_KEYFRAME_MATCH_RATIO"] > 1:
+            raise ValueError(
+                "Invalid value for DEDUP_KEYFRAME_MATCH_RATIO: must be <= 1"
+            )
+
 
 # Global settings instance
 settings = Settings()
@@ -3,6 +3,7 @@
 import os
 
 from config.settings import settings
+from services.dedup_service import DedupService
 from services.dropbox_service import DropboxService
 from services.facebook_service import FacebookService
 from services.instagram_service import InstagramService
@@ -21,6 +22,7 @@ class AuPoSoNeOrchestrator:
         self.dropbox_service = DropboxService()
         self.instagram_service = InstagramService()
         self.facebook_service = FacebookService()
+        self.dedup_service = DedupService()
 
     def process_clips(self, game_name="Valorant", clips_count=None):
         """
@@ -34,35 +36,52 @@ class AuPoSoNeOrchestrator:
             clips_count = settings.CLIPS_COUNT
 
         print(f"Starting clip processing for {game_name}...")
+        self.dedup_service.reset()
 
-        # Fetch clips from Twitch
-        clips = self.twitch_service.get_clips_for_last_24h(game_name, clips_count)
+        # Fetch extra clips from Twitch to replace duplicates and failures
+        candidates_count = min(
+            clips_count * settings.DEDUP_CANDIDATE_FACTOR,
+            TwitchService.MAX_CLIPS_PER_REQUEST,
+        )
+        clips = self.twitch_service.get_clips_for_last_24h(game_name, candidates_count)
 
         if not clips:
             print(f"No clips found for {game_name}")
             return
 
-        print(f"Found {len(clips)} clips to process")
+        print(f"Found {len(clips)} candidate clips for {clips_count} clips to process")
+
+        # Most viewed clips first, so they represent their duplicates
+        clips = self.dedup_service.filter_published_clips(clips)
+        clips = self.dedup_service.rank_clips(clips)
 
         processed_files = []
 
-        # Process each clip
+        # Process clips until enough unique clips succeeded
         with WebScraper() as scraper:
             for i, clip in enumerate(clips):
+                if len(processed_files) >= clips_count:
+                    break
+
+                if self.dedup_service.is_thumbnail_duplicate(clip):
+                    continue
+
                 try:
                     processed_file = self._process_single_clip(
                         scraper, clip, game_name, i
                     )
                     if processed_file:
-                        processed_files.append(processed_file)
+                        self.dedup_service.add_clip(clip)
+                        processed_files.append((clip, processed_file))
                 except Exception as e:
                     print(f"Error processing clip {i + 1}: {e}")
                     continue
 
         # Upload and publish processed files
-        for filepath in processed_files:
+        for clip, filepath in processed_files:
             try:
                 self._upload_and_publish(filepath)
+                self.dedup_service.remember_clip(clip)
                 self._remove_processed_files(filepath, game_name)
             except Exception as e:
                 print(f"Error uploading/publishing {filepath}: {e}")
@@ -84,6 +103,11 @@ class AuPoSoNeOrchestrator:
         original_video_path = get_file_path(game_name, clip_index, is_original=True)
         self.video_service.download_video(video_source_url, original_video_path)
 
+        # Skip clips showing the same moment before the encode and publish
+        if self.dedup_service.is_keyframe_duplicate(clip, original_video_path):
+            remove_files(os.path.basename(original_video_path))
+            return None
+
         # Process video editing
         edited_video_path = get_file_path(game_name, clip_index, is_original=False)
         self.video_service.crop_video_for_reels(original_video_path, edited_video_path)
@@ -0,0 +1,310 @@
+"""Duplicate detection service for near-identical Twitch clips."""
+
+import json
+import os
+import subprocess
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from config.settings import settings
+from utils.file_utils import ensure_directory_exists
+from utils.http_client import get_session
+from utils.perceptual_hash import BKTree, HASH_HEIGHT, HASH_WIDTH, split_frames
+
+
+class DedupService:
+    """Service for skipping clips that show the same moment as another clip."""
+
+    # Shrink every decoded frame to the 9x8 grayscale grid used by dHash
+    hash_filter = f"scale={HASH_WIDTH}:{HASH_HEIGHT}:flags=area,format=gray"
+
+    def __init__(self):
+        self.history_path = settings.DEDUP_HISTORY_PATH
+        self.reset()
+
+    def reset(self):
+        """Forget the current run and reload the recently published clips."""
+        self._thumbnail_index = BKTree()
+        self._keyframe_index = BKTree()
+        self._fingerprints = {}
+        self._history = self._load_history()
+        self._published_clip_ids = {entry["clip_id"] for entry in self._history}
+
+        for entry in self._history:
+            self._index_fingerprint(
+                entry["clip_id"], entry.get("thumbnail"), entry.get("keyframes", [])
+            )
+
+    def filter_published_clips(self, clips):
+        """Drop clips already published within the history, before any hashing."""
+        unpublished_clips = []
+        for clip in clips:
+            if clip["id"] in self._published_clip_ids:
+                print(f"Skipping clip {clip['url']}: already published")
+                continue
+            unpublished_clips.append(clip)
+        return unpublished_clips
+
+    def rank_clips(self, clips):
+        """
+        Sort clips from the most viewed to the least viewed and hash their thumbnails.
+
+        Processing clips in this order makes the first successfully processed
+        clip of each cluster of duplicates its most popular one.
+
+        Args:
+            clips: Clips returned by the Twitch API
+
+        Returns:
+            list: Clips sorted by decreasing view count
+        """
+        ranked_clips = sorted(
+            clips, key=lambda clip: clip.get("view_count", 0), reverse=True
+        )
+
+        # Thumbnails are fetched and hashed in parallel.
+        # The shared session is created first so worker threads all reuse it.
+        get_session()
+        with ThreadPoolExecutor(max_workers=settings.DEDUP_WORKERS) as executor:
+            thumbnail_hashes = list(
+                executor.map(self._get_thumbnail_hash, ranked_clips)
+            )
+
+        for clip, thumbnail_hash in zip(ranked_clips, thumbnail_hashes):
+            self._fingerprints[clip["id"]] = {
+                "thumbnail": thumbnail_hash,
+                "keyframes": [],
+            }
+
+        return ranked_clips
+
+    def is_thumbnail_duplicate(self, clip):
+        """Check whether the thumbnail of a clip matches a kept or recent clip."""
+        thumbnail_hash = self._fingerprints.get(clip["id"], {}).get("thumbnail")
+        if thumbnail_hash is None:
+            return False
+
+        matches = self._thumbnail_index.search(
+            thumbnail_hash, settings.DEDUP_THUMBNAIL_MAX_DISTANCE
+        )
+        if matches:
+            print(
+                f"Skipping clip {clip['url']}: thumbnail matches clip "
+                f"{matches[0][2]} (distance {matches[0][0]})"
+            )
+            return True
+
+        return False
+
+    def is_keyframe_duplicate(self, clip, video_path):
+        """
+        Check whether the keyframes of a downloaded clip match an earlier clip.
+
+        A clip is a duplicate when enough of its keyframes have a near match
+        in the keyframes of a single clip already kept in this run or recently
+        published.
+        """
+        keyframe_hashes = self._get_keyframe_hashes(video_path)
+        fingerprint = self._fingerprints.setdefault(
+            clip["id"], {"thumbnail": None, "keyframes": []}
+        )
+        fingerprint["keyframes"] = keyframe_hashes
+
+        if not keyframe_hashes:
+            return False
+
+        matched_frames = Counter()
+        for keyframe_hash in keyframe_hashes:
+            matched_clip_ids = {
+                payload
+                for _, _, payload in self._keyframe_index.search(
+                    keyframe_hash, settings.DEDUP_KEYFRAME_MAX_DISTANCE
+                )
+            }
+            matched_frames.update(matched_clip_ids)
+
+        if matched_frames:
+            matched_clip_id, frame_count = matched_frames.most_common(1)[0]
+            match_ratio = frame_count / len(keyframe_hashes)
+            if match_ratio >= settings.DEDUP_KEYFRAME_MATCH_RATIO:
+                print(
+                    f"Skipping clip {clip['url']}: {frame_count}/"
+                    f"{len(keyframe_hashes)} keyframes match clip {matched_clip_id}"
+                )
+                return True
+
+        return False
+
+    def add_clip(self, clip):
+        """Index a successfully processed clip so it suppresses its duplicates."""
+        fingerprint = self._fingerprints.get(clip["id"])
+        if not fingerprint:
+            return
+
+        if fingerprint["thumbnail"] is not None:
+            self._thumbnail_index.add(fingerprint["thumbnail"], clip["id"])
+        for keyframe_hash in fingerprint["keyframes"]:
+            self._keyframe_index.add(keyframe_hash, clip["id"])
+
+    def remember_clip(self, clip):
+        """Record a published clip so later runs skip its duplicates."""
+        fingerprint = self._fingerprints.get(clip["id"])
+        if not fingerprint:
+            return
+
+        self._history.append(
+            {
+                "clip_id": clip["id"],
+                "seen_at": datetime.now().isoformat(),
+                "thumbnail": self._to_hex(fingerprint["thumbnail"]),
+                "keyframes": [self._to_hex(h) for h in fingerprint["keyframes"]],
+            }
+        )
+        self._history = self._trim_history(self._history)
+        self._published_clip_ids = {entry["clip_id"] for entry in self._history}
+        self._save_history()
+
+    def _index_fingerprint(self, clip_id, thumbnail_hash, keyframe_hashes):
+        """Add a clip fingerprint loaded from history to the indexes."""
+        if thumbnail_hash:
+            self._thumbnail_index.add(int(thumbnail_hash, 16), clip_id)
+        for keyframe_hash in keyframe_hashes:
+            self._keyframe_index.add(int(keyframe_hash, 16), clip_id)
+
+    def _get_thumbnail_hash(self, clip):
+        """Hash the clip thumbnail, or return None if it cannot be fetched."""
+        thumbnail_url = clip.get("thumbnail_url")
+        if not thumbnail_url:
+            return None
+
+        try:
+            response = get_session().get(thumbnail_url, timeout=10)
+            response.raise_for_status()
+            raw_frames = self._run_ffmpeg(
+                ["-i", "pipe:0", "-frames:v", "1"], stdin_data=response.content
+            )
+            hashes = split_frames(raw_frames)
+            return hashes[0] if hashes else None
+        except Exception as e:
+            print(f"Could not hash thumbnail {thumbnail_url}: {e}")
+            return None
+
+    def _get_keyframe_hashes(self, video_path):
+        """Hash the keyframes of a local video without decoding the other frames."""
+        try:
+            raw_frames = self._run_ffmpeg(
+                [
+                    "-skip_frame",
+                    "nokey",
+                    "-i",
+                    video_path,
+                    "-fps_mode",
+                    "passthrough",
+                    "-frames:v",
+                    str(settings.DEDUP_MAX_KEYFRAMES),
+                ]
+            )
+            return split_frames(raw_frames)
+        except Exception as e:
+            print(f"Could not hash keyframes of {video_path}: {e}")
+            return []
+
+    def _run_ffmpeg(self, input_args, stdin_data=None):
+        """Run FFmpeg and return its raw 9x8 grayscale frames."""
+        result = subprocess.run(
+            [
+                "ffmpeg",
+                "-loglevel",
+                "error",
+                *input_args,
+                "-vf",
+                self.hash_filter,
+                "-f",
+                "rawvideo",
+                "pipe:1",
+            ],
+            input=stdin_data,
+            capture_output=True,
+            check=True,
+        )
+        return result.stdout
+
+    def _load_history(self):
+        """Load fingerprints of clips published within the history window and size."""
+        if not os.path.isfile(self.history_path):
+            return []
+
+        try:
+            with open(self.history_path, "r", encoding="utf-8") as f:
+                history = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable dedup history {self.history_path}: {e}")
+            return []
+
+        if not isinstance(history, list):
+            print(f"Ignoring unreadable dedup history {self.history_path}: not a list")
+            return []
+
+        oldest_allowed = datetime.now() - timedelta(hours=settings.DEDUP_HISTORY_HOURS)
+        recent_entries = []
+        skipped_count = 0
+        for entry in history:
+            try:
+                seen_at = self._check_history_entry(entry)
+            except (TypeError, KeyError, ValueError):
+                skipped_count += 1
+                continue
+
+            if seen_at >= oldest_allowed:
+                recent_entries.append(entry)
+
+        if skipped_count:
+            print(
+                f"Skipped {skipped_count} malformed entries in dedup history "
+                f"{self.history_path}"
+            )
+        return self._trim_history(recent_entries)
+
+    @staticmethod
+    def _trim_history(history):
+        """Keep only the most recently published clips of the history."""
+        max_clips = settings.DEDUP_HISTORY_MAX_CLIPS
+        return history[-max_clips:] if max_clips else []
+
+    @staticmethod
+    def _check_history_entry(entry):
+        """
+        Check the layout of a history entry.
+
+        Returns:
+            datetime: When the clip was published
+
+        Raises:
+            TypeError, KeyError, ValueError: If the entry is malformed
+        """
+        if not isinstance(entry, dict):
+            raise TypeError("entry must be an object")
+        if not isinstance(entry.get("clip_id"), str):
+            raise TypeError("clip_id must be a string")
+
+        hashes = entry.get("keyframes", [])
+        if not isinstance(hashes, list):
+            raise TypeError("keyframes must be a list")
+        if entry.get("thumbnail") is not None:
+            hashes = hashes + [entry["thumbnail"]]
+        for hash_value in hashes:
+            int(hash_value, 16)
+
+        return datetime.fromisoformat(entry["seen_at"])
+
+    def _save_history(self):
+        """Persist the fingerprints of recently published clips."""
+        ensure_directory_exists(self.history_path)
+        with open(self.history_path, "w", encoding="utf-8") as f:
+            json.dump(self._history, f)
+
+    @staticmethod
+    def _to_hex(hash_value):
+        """Serialize a hash for the JSON history file."""
+        return None if hash_value is None else format(hash_value, "016x")
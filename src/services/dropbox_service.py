@@ -3,9 +3,8 @@
 import json
 import os
 
-import requests
-
 from config.settings import settings
+from utils.http_client import get_session
 
 
 class DropboxService:
@@ -43,7 +42,7 @@ class DropboxService:
         }
 
         with open(filepath, "rb") as f:
-            upload_response = requests.post(upload_url, headers=headers, data=f)
+            upload_response = get_session().post(upload_url, headers=headers, data=f)
 
         if upload_response.status_code != 200:
             print(f"Upload failed with status {upload_response.status_code}")
@@ -64,7 +63,9 @@ class DropboxService:
 
         data = {"path": remote_path}
 
-        response = requests.post(get_link_url, headers=headers, data=json.dumps(data))
+        response = get_session().post(
+            get_link_url, headers=headers, data=json.dumps(data)
+        )
         response.raise_for_status()
 
         link = response.json().get("link", "")
@@ -83,7 +84,9 @@ class DropboxService:
             "Content-Type": "application/json",
         }
 
-        response = requests.post(delete_url, headers=headers, data=json.dumps(data))
+        response = get_session().post(
+            delete_url, headers=headers, data=json.dumps(data)
+        )
         response.raise_for_status()
 
         print("Successfully deleted all game files from Dropbox")
@@ -1,8 +1,7 @@
 """Facebook service for publishing reels."""
 
-import requests
-
 from config.settings import settings
+from utils.http_client import get_session
 
 
 class FacebookService:
@@ -34,7 +33,7 @@ class FacebookService:
             # description: 'Description',
         }
 
-        response = requests.post(url, data=payload)
+        response = get_session().post(url, data=payload)
         response.raise_for_status()
 
         post_id = response.json().get("id")
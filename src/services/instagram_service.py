@@ -5,6 +5,7 @@ import time
 import requests
 
 from config.settings import settings
+from utils.http_client import get_session
 
 
 class InstagramService:
@@ -26,7 +27,7 @@ class InstagramService:
             "Authorization": f"Bearer {self.access_token}",
         }
 
-        response = requests.post(url, json=payload, headers=headers)
+        response = get_session().post(url, json=payload, headers=headers)
         response.raise_for_status()
 
         container_id = response.json().get("id")
@@ -45,21 +46,21 @@ class InstagramService:
             "Authorization": f"Bearer {self.access_token}",
         }
 
-        response = requests.post(url, json=payload, headers=headers)
+        response = get_session().post(url, json=payload, headers=headers)
         response.raise_for_status()
 
         publish_response = response.json()
         print(f"Publication successful: {publish_response}")
         return publish_response
 
-    def publish_with_retry(self, video_url, max_wait_time=600, retry_interval=60):
+    def publish_with_retry(self, video_url, max_wait_time=None, retry_interval=None):
         """
         Create a container and publish it with retry logic.
 
         Args:
             video_url: The URL of the video to publish
-            max_wait_time: Maximum time to wait in seconds (default: 10 minutes)
-            retry_interval: Time between retries in seconds (default: 1 minute)
+            max_wait_time: Maximum time to wait in seconds (default from settings)
+            retry_interval: Time between retries in seconds (default from settings)
 
         Returns:
             dict: Publication response if successful
@@ -68,6 +69,11 @@ class InstagramService:
             Exception: If publication fails after max_wait_time
         """
 
+        if max_wait_time is None:
+            max_wait_time = settings.INSTAGRAM_MAX_WAIT_TIME
+        if retry_interval is None:
+            retry_interval = settings.INSTAGRAM_RETRY_INTERVAL
+
         container_id = self._create_container(video_url)
 
         # Wait initial time before first attempt
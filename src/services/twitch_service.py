@@ -2,14 +2,16 @@
 
 from datetime import datetime, timedelta
 
-import requests
-
 from config.settings import settings
+from utils.http_client import get_session
 
 
 class TwitchService:
     """Service for interacting with Twitch API."""
 
+    # Maximum value of the "first" parameter of the clips endpoint
+    MAX_CLIPS_PER_REQUEST = 100
+
     def __init__(self):
         self.client_id = settings.TWITCH_CLIENT_ID
         self.client_secret = settings.TWITCH_CLIENT_SECRET
@@ -24,7 +26,7 @@ class TwitchService:
             "grant_type": "client_credentials",
         }
 
-        response = requests.post(oauth_token_url, params=params)
+        response = get_session().post(oauth_token_url, params=params)
         response.raise_for_status()
         self._access_token = response.json()["access_token"]
         return self._access_token
@@ -39,13 +41,25 @@ class TwitchService:
             "Authorization": f"Bearer {self._access_token}",
         }
 
+    def _get(self, url, params=None):
+        """Send an authorized GET request, refreshing an expired token once."""
+        response = get_session().get(url, headers=self._get_headers(), params=params)
+
+        if response.status_code == 401:
+            print("Twitch access token rejected, requesting a new one...")
+            self._access_token = None
+            response = get_session().get(
+                url, headers=self._get_headers(), params=params
+            )
+
+        response.raise_for_status()
+        return response
+
     def get_game_id(self, game_name):
         """Get game ID by game name."""
         twitch_api_endpoint = f"https://api.twitch.tv/helix/games?name={game_name}"
-        headers = self._get_headers()
 
-        response = requests.get(twitch_api_endpoint, headers=headers)
-        response.raise_for_status()
+        response = self._get(twitch_api_endpoint)
         data = response.json()["data"]
 
         if not data:
@@ -56,7 +70,6 @@ class TwitchService:
     def get_clips(self, game_id, started_at, ended_at, clips_count):
         """Get clips for a specific game within a time range."""
         twitch_clips_api_url = "https://api.twitch.tv/helix/clips"
-        headers = self._get_headers()
 
         params = {
             "game_id": game_id,
@@ -65,8 +78,7 @@ class TwitchService:
             "ended_at": ended_at,
         }
 
-        response = requests.get(twitch_clips_api_url, headers=headers, params=params)
-        response.raise_for_status()
+        response = self._get(twitch_clips_api_url, params=params)
         return response.json()["data"]
 
     def get_clips_for_last_24h(self, game_name, clips_count=1):
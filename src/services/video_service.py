@@ -2,27 +2,23 @@
 
 import subprocess
 
-import requests
-
+from config.settings import settings
 from utils.file_utils import ensure_directory_exists
+from utils.http_client import get_session
 
 
 class VideoService:
     """Service for video download and processing operations."""
 
-    libavfilters = {
-        "fps": "[0:v]crop=ih*4/3:ih:(iw-ih*4/3)/2:0,scale=1080:-1[cropped];[cropped]scale=-1:1920,boxblur=luma_radius=min(h\\,w)/40:luma_power=3:chroma_radius=min(cw\\,ch)/40:chroma_power=1[bg];[bg][cropped]overlay=(W-w)/2:(H-h)/2,setsar=1,crop=w=1080:h=1920"
-    }
-
     def download_video(self, video_url, output_path):
         """Download video from URL to specified path."""
         ensure_directory_exists(output_path)
 
-        response = requests.get(video_url, stream=True)
+        response = get_session().get(video_url, stream=True)
         response.raise_for_status()
 
         with open(output_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
+            for chunk in response.iter_content(chunk_size=settings.DOWNLOAD_CHUNK_SIZE):
                 f.write(chunk)
 
         print(f"Downloaded video to: {output_path}")
@@ -39,7 +35,7 @@ class VideoService:
                     "-i",
                     input_file_path,
                     "-lavfi",
-                    self.libavfilters["fps"],
+                    settings.ENCODE_PROFILES[settings.ENCODE_PROFILE],
                     output_file_path,
                 ],
                 check=True,
@@ -0,0 +1,31 @@
+"""Shared HTTP session with a configurable connection pool."""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config.settings import settings
+
+_session = None
+_session_pool_size = None
+
+
+def get_session():
+    """Get the shared HTTP session, rebuilt when the pool size setting changes."""
+    global _session, _session_pool_size
+
+    if _session is None or _session_pool_size != settings.HTTP_POOL_SIZE:
+        if _session is not None:
+            _session.close()
+
+        adapter = HTTPAdapter(
+            pool_connections=settings.HTTP_POOL_SIZE,
+            pool_maxsize=settings.HTTP_POOL_SIZE,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        _session = session
+        _session_pool_size = settings.HTTP_POOL_SIZE
+
+    return _session
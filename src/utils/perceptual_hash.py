@@ -0,0 +1,100 @@
+"""Perceptual hashing utilities for near-duplicate detection."""
+
+HASH_WIDTH = 9
+HASH_HEIGHT = 8
+HASH_FRAME_SIZE = HASH_WIDTH * HASH_HEIGHT
+
+
+def difference_hash(pixels):
+    """
+    Compute a 64-bit difference hash (dHash) from grayscale pixels.
+
+    Args:
+        pixels: 9x8 grayscale pixels as raw bytes, row by row
+
+    Returns:
+        int: Hash where each bit tells if a pixel is brighter than its right neighbour
+    """
+    if len(pixels) != HASH_FRAME_SIZE:
+        raise ValueError(
+            f"Expected {HASH_FRAME_SIZE} pixels, got {len(pixels)} pixels"
+        )
+
+    value = 0
+    for row in range(HASH_HEIGHT):
+        offset = row * HASH_WIDTH
+        for column in range(HASH_WIDTH - 1):
+            left = pixels[offset + column]
+            right = pixels[offset + column + 1]
+            value = (value << 1) | (1 if left > right else 0)
+    return value
+
+
+def split_frames(raw_frames):
+    """Split raw 9x8 grayscale video output into one hash per frame."""
+    return [
+        difference_hash(raw_frames[start : start + HASH_FRAME_SIZE])
+        for start in range(0, len(raw_frames) - HASH_FRAME_SIZE + 1, HASH_FRAME_SIZE)
+    ]
+
+
+def hamming_distance(first_hash, second_hash):
+    """Count the number of differing bits between two hashes."""
+    return bin(first_hash ^ second_hash).count("1")
+
+
+class BKTree:
+    """BK-tree indexing hashes by Hamming distance for fast neighbour lookups."""
+
+    def __init__(self):
+        self._root = None
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def add(self, hash_value, payload=None):
+        """Insert a hash and its associated payload in the tree."""
+        self._size += 1
+        node = (hash_value, payload, {})
+
+        if self._root is None:
+            self._root = node
+            return
+
+        current = self._root
+        while True:
+            distance = hamming_distance(hash_value, current[0])
+            children = current[2]
+            if distance not in children:
+                children[distance] = node
+                return
+            current = children[distance]
+
+    def search(self, hash_value, max_distance):
+        """
+        Find every indexed hash within max_distance of hash_value.
+
+        Returns:
+            list: (distance, hash, payload) tuples sorted by distance
+        """
+        if self._root is None:
+            return []
+
+        matches = []
+        candidates = [self._root]
+        while candidates:
+            node_hash, payload, children = candidates.pop()
+            distance = hamming_distance(hash_value, node_hash)
+            if distance <= max_distance:
+                matches.append((distance, node_hash, payload))
+
+            # Triangle inequality: only subtrees in this band can hold matches
+            low = distance - max_distance
+            high = distance + max_distance
+            for child_distance, child in children.items():
+                if low <= child_distance <= high:
+                    candidates.append(child)
+
+        matches.sort(key=lambda match: match[0])
+        return matches
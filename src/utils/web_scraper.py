@@ -38,7 +38,7 @@ class WebScraper:
         researched_tag = "video"
 
         # Wait for video element to be present
-        video_element = WebDriverWait(self.driver, 60).until(
+        video_element = WebDriverWait(self.driver, settings.SCRAPER_WAIT_TIMEOUT).until(
             EC.presence_of_element_located((By.TAG_NAME, researched_tag)),
         )
 